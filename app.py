@@ -1,8 +1,8 @@
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
-from starlette.requests import Request
 
 import library.api_router
 import heat.api_router
@@ -37,17 +37,24 @@ app = FastAPI(
     description=description,
     version=VERSION,
     openapi_tags=tags_metadata,
+    default_response_class=ORJSONResponse,
 )
 
+# compress larger responses, e.g. model results and TMY data, for clients that
+# accept gzip. Responses that are already compressed are passed through.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # configure static files for the app
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# The home page has no request specific content, so render it once.
 templates = Jinja2Templates("templates")
+INDEX_HTML = templates.get_template("index.html").render({})
 
 
 @app.get("/", include_in_schema=False)
-async def index(request: Request):
-    return templates.TemplateResponse(request=request, name="index.html", context={})
+async def index():
+    return HTMLResponse(INDEX_HTML)
 
 
 # Define a route for the favicon
@@ -56,9 +63,13 @@ async def index(request: Request):
 #    return FileResponse("/static/img/heat-pump.png")
 
 
+# The version information is constant, so serialize it once.
+VERSION_JSON = Version(version=VERSION, version_date=VERSION_DATE).model_dump_json()
+
+
 @app.get("/version", response_model=Version, tags=["General"])
-async def version() -> Version:
-    return Version(version=VERSION, version_date=VERSION_DATE)
+async def version() -> Response:
+    return Response(VERSION_JSON, media_type="application/json")
 
 
 # routes that related to the Energy Library database supporting the app, including
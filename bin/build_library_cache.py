@@ -0,0 +1,17 @@
+# Downloads the library datasets and saves them in the library cache file,
+# library/data/library_cache.pkl. While that file is less than LIB_TIMEOUT
+# hours old, the API server processes load it at startup instead of downloading
+# and processing the data themselves. Run it before starting the server:
+#
+#     python bin/build_library_cache.py
+#
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from library.datasets import download_data, write_cache, CACHE_PATH
+
+print("Downloading library data...")
+write_cache(download_data())
+print(f"Library cache written to {CACHE_PATH}")
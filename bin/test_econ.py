@@ -0,0 +1,40 @@
+# Checks of the economic analysis functions. Run from the 'bin' directory:
+#
+#     python test_econ.py
+#
+# Prints a message for each check that fails.
+import sys
+
+sys.path.insert(0, "../")
+
+import numpy as np
+from pydantic import ValidationError
+
+from econ.econ import payback
+from econ.models import PeriodicAmount
+
+print("Testing payback...")
+cases = (
+    # (cash flow, expected payback)
+    ([-1000.0, 200.0, 200.0, 200.0, 200.0, 200.0, 200.0], 5.0),
+    ([-10.0, 5.0, 4.0], None),
+    ([5.0, -1.0, 3.0], 0.0),
+    # year 0 is exactly zero and the cumulative cash goes negative later, e.g. a
+    # fully financed heat pump with no rebate.
+    ([0.0, -100.0, -100.0, -100.0, 100.0, 100.0, 100.0, 100.0, 100.0, 100.0], 6.0),
+    ([0.0, -50.0, 25.0, 50.0], 2.5),
+)
+for cash_flow, expected in cases:
+    result = payback(np.array(cash_flow))
+    if (result is None or expected is None) and result is not expected:
+        print(f"Problem with payback of {cash_flow}: {result}, expected {expected}")
+    elif result is not None and not np.isclose(result, expected):
+        print(f"Problem with payback of {cash_flow}: {result}, expected {expected}")
+
+print("Testing PeriodicAmount...")
+for interval in (0, -2):
+    try:
+        PeriodicAmount(amount=100.0, interval=interval)
+        print(f"Problem with interval {interval}: no validation error")
+    except ValidationError:
+        pass
@@ -1,7 +1,11 @@
 """Defines the API for Economic analysis functions."""
 
-from typing import List, Dict
+import collections
+import threading
+
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import Response
 
 from . import econ
 from .models import CashFlowInputs, CashFlowAnalysis
@@ -9,10 +13,46 @@ from .models import CashFlowInputs, CashFlowAnalysis
 router = APIRouter()
 
 
+# Serialized cash flow analyses, keyed by the JSON of their inputs, most recently
+# used last. Users often submit the same inputs again, e.g. while adjusting other
+# parts of a heat pump analysis. The route runs in FastAPI's threadpool, so access
+# is done while holding the lock.
+CASH_FLOW_CACHE_SIZE = 1024
+_cash_flow_cache = collections.OrderedDict()
+_cash_flow_cache_lock = threading.Lock()
+
+
+def _cash_flow_json(flows: CashFlowInputs) -> bytes:
+    """Returns the serialized cash flow analysis for 'flows', using the cached
+    result if these inputs were analyzed recently.
+    """
+    # model_dump_json() serializes in a single pass, with fields in their defined
+    # order, so equal inputs always give the same key.
+    key = flows.model_dump_json()
+    with _cash_flow_cache_lock:
+        body = _cash_flow_cache.get(key)
+        if body is not None:
+            _cash_flow_cache.move_to_end(key)
+            return body
+
+    # the analysis result is built internally, so skip FastAPI's response validation
+    body = orjson.dumps(
+        econ.analyze_cash_flow(flows).model_dump(),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    with _cash_flow_cache_lock:
+        _cash_flow_cache[key] = body
+        if len(_cash_flow_cache) > CASH_FLOW_CACHE_SIZE:
+            _cash_flow_cache.popitem(last=False)
+    return body
+
+
 @router.post(
     "/econ/analyze-cash-flows",
     response_model=CashFlowAnalysis,
     tags=["Economic Analysis"],
 )
-async def analyze_cash_flow(flows: CashFlowInputs) -> CashFlowAnalysis:
-    return econ.analyze_cash_flow(flows)
+def analyze_cash_flow(flows: CashFlowInputs) -> Response:
+    # a plain 'def' so FastAPI runs this CPU bound analysis in its threadpool
+    # instead of blocking the event loop.
+    return Response(_cash_flow_json(flows), media_type="application/json")
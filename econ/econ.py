@@ -1,9 +1,27 @@
+import functools
+import math
+from typing import List
+
 import numpy as np
 import numpy_financial as npf
 
-from .models import CashFlowInputs, CashFlowAnalysis
+from .models import CashFlowItem, CashFlowInputs, CashFlowAnalysis
 from general.utils import chg_nonnum
 
+# Newton's method for the internal rate of return stops when the change in the
+# rate is smaller than this.
+IRR_TOLERANCE = 1e-12
+
+
+@functools.lru_cache(maxsize=64)
+def _years(count: int) -> np.ndarray:
+    """Returns a read-only array of year numbers 0, 1, ... count - 1. Cached because
+    the same cash flow lengths are used over and over.
+    """
+    yrs = np.arange(count)
+    yrs.setflags(write=False)
+    return yrs
+
 
 def payback(cash_flow: np.ndarray) -> float | None:
     """Returns the year (first element is year 0) that the cash flow accumulates
@@ -15,7 +33,8 @@ def payback(cash_flow: np.ndarray) -> float | None:
     payback, pass the discounted cash flow.
     """
     cum_cash = cash_flow.cumsum()
-    if cum_cash.min() > 0.0:
+    neg = cum_cash < 0.0
+    if not neg.any():
         # cumulative cash is never negative
         return 0.0
 
@@ -23,43 +42,88 @@ def payback(cash_flow: np.ndarray) -> float | None:
         # never reaches 0
         return None
 
-    # create an array of the year values associated with the cash flow
-    yrs = np.array(range(len(cash_flow)))
+    # index of the year after the last year with negative cumulative cash. The
+    # cumulative cash is not necessarily increasing (e.g. a financed cost that starts
+    # at zero and goes negative, or periodic replacement costs), so this is the
+    # last crossing, not the first.
+    i = len(cum_cash) - int(neg[::-1].argmax())
+
+    # interpolate between the prior year, which is negative, and this year
+    return (i - 1) - cum_cash[i - 1] / (cum_cash[i] - cum_cash[i - 1])
 
-    # use numpy interpolate to determine zero crossing
-    return np.interp(0.0, cum_cash, yrs)
+
+def cash_flow_matrix(items: List[CashFlowItem], duration: int) -> np.ndarray:
+    """Returns a 2D array of the cash flows of the CashFlowItem's in 'items', one row
+    per item. Each row has 'duration' + 1 elements, starting with year 0. The matrix
+    starts as zeros and the items write their non-zero years directly into their rows.
+    """
+    flows = np.zeros((len(items), duration + 1))
+    for item, row in zip(items, flows):
+        item.fill(row, duration)
+    return flows
+
+
+def irr(cash_flow: np.ndarray) -> float | None:
+    """Returns the internal rate of return of the cash flow, or None if it can't
+    be calculated.
+
+    Most cash flows here are an up front cost followed by savings, so the flow
+    changes sign just once. That kind of cash flow has only one rate of return, and
+    it is found with Newton's method on the NPV. This is much faster than the
+    polynomial root finder in numpy_financial.irr(). Other cash flows, or ones
+    where Newton's method doesn't converge, use numpy_financial.irr().
+    """
+    signs = np.sign(cash_flow[cash_flow != 0.0])
+    if np.count_nonzero(signs[1:] != signs[:-1]) == 1:
+        yrs = _years(len(cash_flow))
+        yr_cash = yrs * cash_flow
+        rate = 0.1
+        with np.errstate(all="ignore"):
+            for _ in range(50):
+                disc_mult = (1.0 + rate) ** -yrs
+                npv = cash_flow @ disc_mult
+                d_npv = -(yr_cash @ disc_mult) / (1.0 + rate)
+                step = npv / d_npv
+                rate -= step
+                if not math.isfinite(rate) or rate <= -1.0:
+                    break
+                if abs(step) < IRR_TOLERANCE:
+                    return rate
+
+    return chg_nonnum(npf.irr(cash_flow), None)
 
 
 def analyze_cash_flow(inp: CashFlowInputs) -> CashFlowAnalysis:
     # Dictionary of results
     results = {}
 
-    # Cash Flow table, starting with a column for the Year
-    table = {"Year": list(range(inp.duration + 1))}
-    net_cash = None  # array containing total of cash flows.
-    for flow in inp.cash_flow_items:
-        cash_array = flow.cash_flow(inp.duration)
-        table[flow.label] = list(cash_array)
-        if net_cash is not None:
-            net_cash += cash_array
-        else:
-            net_cash = cash_array
+    # 2D array of the cash flows, one row for each cash flow item, and the net
+    # cash flow, which is the total of those rows.
+    flows = cash_flow_matrix(inp.cash_flow_items, inp.duration)
+    net_cash = flows.sum(axis=0)
+
+    # Cash Flow table, starting with a column for the Year. Convert all of the
+    # cash flow rows to Python lists in one call.
+    table = {"Year": _years(inp.duration + 1).tolist()}
+    for flow, cash_list in zip(inp.cash_flow_items, flows.tolist()):
+        table[flow.label] = cash_list
 
-    table["Net Cash"] = list(net_cash)
+    table["Net Cash"] = net_cash.tolist()
     results["cash_flow_table"] = table
 
-    # internal rate of return, converted to None if can't be calculated
-    irr = chg_nonnum(npf.irr(net_cash), None)
-    results["irr"] = irr
+    # internal rate of return, None if it can't be calculated
+    results["irr"] = irr(net_cash)
 
     if inp.discount_rate is not None:
+        # discount multipliers for each year, used for both the net present value
+        # and the discounted payback
+        disc_mult = (1.0 + inp.discount_rate) ** -_years(inp.duration + 1)
+
         # Calculate net present value
-        npv = npf.npv(inp.discount_rate, net_cash)
+        npv = net_cash @ disc_mult
 
         # determine discounted payback
         # create a discounted cash flow
-        disc_mult = np.ones(inp.duration) / (1.0 + inp.discount_rate)
-        disc_mult = np.insert(disc_mult.cumprod(), 0, 1.0)
         disc_cash = disc_mult * net_cash
         discounted_payback = payback(disc_cash)
 
@@ -85,4 +149,6 @@ def analyze_cash_flow(inp: CashFlowInputs) -> CashFlowAnalysis:
     # simple payback
     results["simple_payback"] = payback(net_cash)
 
-    return CashFlowAnalysis(**results)
+    # The results were computed here and don't need validation, so build the
+    # model directly. The keys of 'results' must match the model's field names.
+    return CashFlowAnalysis.model_construct(**results)
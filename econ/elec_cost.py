@@ -3,6 +3,9 @@ given a block rate structure, possibly including PCE.
 """
 
 from math import inf
+
+import numpy as np
+
 from general.utils import chg_nonnum
 
 
@@ -86,27 +89,31 @@ class ElecCostCalc:
 
     def monthly_cost(self, kwh_energy, kw_demand=0.0):
         """Returns the total electric cost for a month, given energy usage of
-        'kwh_energy' and peak demand of 'kw_demand'.
+        'kwh_energy' and peak demand of 'kw_demand'. Both can also be NumPy arrays,
+        e.g. of values for each month, in which case an array of costs is returned.
         """
         # customer charge
         cost = chg_nonnum(self.utility.CustomerChg, 0.0) * (1.0 + self.sales_tax)
 
         # demand charge
         cost += (
-            kw_demand
+            np.asarray(kw_demand)
             * chg_nonnum(self.utility.DemandCharge, 0.0)
             * (1.0 + self.sales_tax)
         )
 
-        remaining_kwh = kwh_energy
+        remaining_kwh = np.asarray(kwh_energy, dtype=float)
+        # tracks the months that still have kWh to be priced in later blocks
+        active = np.ones(remaining_kwh.shape, dtype=bool)
         for b_kwh, b_rate in self._blocks:
-            kwh_in_block = min(remaining_kwh, b_kwh)
-            cost += kwh_in_block * b_rate
-            remaining_kwh -= kwh_in_block
-            if remaining_kwh < 0.1:  # 0.1 kWh in case of rounding issues
+            kwh_in_block = np.minimum(remaining_kwh, b_kwh)
+            cost = cost + np.where(active, kwh_in_block * b_rate, 0.0)
+            remaining_kwh = remaining_kwh - kwh_in_block
+            active &= ~(remaining_kwh < 0.1)  # 0.1 kWh in case of rounding issues
+            if not active.any():
                 break
 
-        return cost
+        return cost if np.ndim(cost) else float(cost)
 
     def final_blocks(self):
         """Debug method to return underlying rate blocks"""
@@ -2,7 +2,7 @@
 
 from typing import List, Dict
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 import numpy as np
 
 # --------------- Cash Flow Item models
@@ -12,6 +12,11 @@ import numpy as np
 
 
 class CashFlowItem(BaseModel):
+    # Cash flow items are not changed after they are created. Extra fields are
+    # rejected so an item only validates as the class whose fields it has, e.g. a
+    # PeriodicAmount with a bad 'interval' is an error, not an InitialAmount.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     label: str = "Cash Flow Item"  # Label for this cash flow item
 
     # Base amount used to generate a cash flow. Could be an initial year 0 amount,
@@ -22,17 +27,23 @@ class CashFlowItem(BaseModel):
         # Returns a numpy array containing the cash flow.  The first element of the
         # array is the year 0 amount, followed by 'duration' additional elements spanning
         # the remaining years of the cash flow.
+        result = np.zeros(duration + 1)
+        self.fill(result, duration)
+        return result
+
+    def fill(self, out: np.ndarray, duration: int):
+        # Writes the cash flow into 'out', an array of 'duration' + 1 elements laid
+        # out like the cash_flow() result, e.g. a row of a matrix of cash flows.
+        # 'out' is all zeros on entry, so only the non-zero years need to be written.
         # This method should be overridden by the subclass.
-        return np.zeros(duration + 1)
+        pass
 
 
 class InitialAmount(CashFlowItem):
     """An amount that occurs in year 0."""
 
-    def cash_flow(self, duration: int) -> np.ndarray:
-        result = np.zeros(duration + 1)
-        result[0] = self.amount
-        return result
+    def fill(self, out: np.ndarray, duration: int):
+        out[0] = self.amount
 
 
 class EscalatingFlow(CashFlowItem):
@@ -46,14 +57,13 @@ class EscalatingFlow(CashFlowItem):
     )
     end_year: int | None = None  # last year of cash flow
 
-    def cash_flow(self, duration: int) -> np.ndarray:
-        pat = np.ones(duration - 1) * (1 + self.escalation_rate)
-        result = np.insert(pat.cumprod(), 0, [0.0, 1.0]) * self.amount
+    def fill(self, out: np.ndarray, duration: int):
+        # year 0 is zero; year 'n' is amount * (1 + escalation_rate) ** (n - 1)
+        np.power(1.0 + self.escalation_rate, np.arange(duration), out=out[1:])
+        out[1:] *= self.amount
         # blank out last elements if there is an end year
         if self.end_year is not None:
-            result[self.end_year + 1 :] = 0.0
-
-        return result
+            out[self.end_year + 1 :] = 0.0
 
 
 class PatternFlow(CashFlowItem):
@@ -68,16 +78,13 @@ class PatternFlow(CashFlowItem):
     # excess values are ignored.
     pattern: List[float]
 
-    def cash_flow(self, duration: int) -> np.ndarray:
-        pat = np.array(self.pattern)
-        if len(pat) < duration + 1:
-            # need to extend the pattern
-            pat = np.concatenate([pat, np.full(duration + 1 - len(pat), pat[-1])])
-        elif len(pat) > duration + 1:
-            # need to truncate the pattern
-            pat = pat[: duration + 1]
-
-        return self.amount * pat
+    def fill(self, out: np.ndarray, duration: int):
+        # copy the pattern, truncating it if longer than the cash flow
+        n = min(len(self.pattern), duration + 1)
+        out[:n] = self.pattern[:n]
+        # extend the last pattern value through the end of the cash flow
+        out[n:] = self.pattern[-1]
+        out *= self.amount
 
 
 class PeriodicAmount(CashFlowItem):
@@ -86,19 +93,20 @@ class PeriodicAmount(CashFlowItem):
     not year 0. This class is useful for modeling replacement costs.
     """
 
-    # Spacing in years between recurring amounts
-    interval: int
+    # Spacing in years between recurring amounts; must be at least 1.
+    interval: int = Field(gt=0)
 
     # Escalation rate between occurences. The first occurrence *does* receive escalation
     # measured from year 0. The escalation rate is expressed as a fraction, e.g. 0.02 means
     # 2%/year.
     escalation_rate: float = 0.0
 
-    def cash_flow(self, duration: int) -> np.ndarray:
-        result = np.zeros(duration + 1)
-        for yr in range(self.interval, duration + 1, self.interval):
-            result[yr] = self.amount * (1 + self.escalation_rate) ** yr
-        return result
+    def fill(self, out: np.ndarray, duration: int):
+        yrs = np.arange(self.interval, duration + 1, self.interval)
+        # escalation multiplier for each recurrence: one 'step' of escalation per
+        # interval, accumulated with a running product rather than a power per year.
+        step = (1 + self.escalation_rate) ** self.interval
+        out[yrs] = self.amount * np.full(len(yrs), step).cumprod()
 
 
 # -----------------------------------------
@@ -2,7 +2,6 @@
 
 import math
 import numbers
-import simplejson
 from typing import List
 
 import pandas as pd
@@ -52,10 +51,17 @@ def is_null(val):
 
 
 def nan_to_none(obj):
-    """Converts the NaN values found in an object 'obj' into None values. Only
-    works objects that can be serialized to JSON.
+    """Converts the NaN (and infinite) values found in an object 'obj' into None
+    values. Walks nested dictionaries, lists and tuples in one pass; tuples are
+    returned as lists, as they would be after a JSON round trip.
     """
-    return simplejson.loads(simplejson.dumps(obj, ignore_nan=True))
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [nan_to_none(v) for v in obj]
+    return obj
 
 
 def models_to_dataframe(model_list: List[BaseModel]) -> pd.DataFrame:
@@ -1,6 +1,7 @@
 """Defines the API for the Space Heat and Heat Pump modeling functions."""
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from . import home_heat_model as heat
 from . import heat_pump_analysis as analyze
@@ -19,8 +20,11 @@ router = APIRouter()
     response_model=DetailedModelResults,
     tags=["Heating Models"],
 )
-async def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
-    return heat.model_space_heat(inp)
+def model_space_heat(inp: HeatModelInputs) -> ORJSONResponse:
+    # Plain 'def' routes, so FastAPI runs these CPU bound models in its threadpool
+    # instead of blocking the event loop, returning the results, which are built by
+    # validated models, without FastAPI's response validation.
+    return ORJSONResponse(heat.model_space_heat(inp).model_dump())
 
 
 @router.post(
@@ -28,8 +32,8 @@ async def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
     response_model=HeatPumpAnalysisResults,
     tags=["Heating Models"],
 )
-async def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
-    return analyze.analyze_heat_pump(inp)
+def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> ORJSONResponse:
+    return ORJSONResponse(analyze.analyze_heat_pump(inp).model_dump())
 
 
 """
@@ -74,25 +74,30 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     inp_hpc = inp.heat_pump_cost
     inp_econ = inp.economic_inputs
     inp_actual = inp.actual_fuel_use
+    exist_heat = inp_bldg.exist_heat_system
 
     # acquire some key objects
-    city = lib.city_from_id(inp.bldg_model_inputs.city_id)
-    fuel = lib.fuel_from_id(inp.bldg_model_inputs.exist_heat_system.heat_fuel_id)
+    city = lib.city_from_id(inp_bldg.city_id)
+    fuel = lib.fuel_from_id(exist_heat.heat_fuel_id)
     elec_util = lib.util_from_id(inp_econ.utility_id)
 
-    # Some of the fields in the electric utility object may be overridden.
-    # Adjust the object now.
+    # Some of the fields in the electric utility object may be overridden. The
+    # library object is shared, so gather the overrides and apply them to a copy,
+    # only making the copy if there are overrides.
+    util_overrides = {}
     if inp_econ.elec_rate_override is not None:
         # overwrite the block structure with one block
-        elec_util.Blocks = [(None, inp_econ.elec_rate_override)]
+        util_overrides["Blocks"] = [(None, inp_econ.elec_rate_override)]
         # zero out the demand charge as that is included in the overridden electric rate.
-        elec_util.DemandCharge = 0.0
+        util_overrides["DemandCharge"] = 0.0
     if inp_econ.pce_rate_override is not None:
-        elec_util.PCE = inp_econ.pce_rate_override
+        util_overrides["PCE"] = inp_econ.pce_rate_override
     if inp_econ.customer_charge_override is not None:
-        elec_util.CustomerChg = inp_econ.customer_charge_override
+        util_overrides["CustomerChg"] = inp_econ.customer_charge_override
     if inp_econ.co2_lbs_per_kwh_override is not None:
-        elec_util.CO2 = inp_econ.co2_lbs_per_kwh_override
+        util_overrides["CO2"] = inp_econ.co2_lbs_per_kwh_override
+    if util_overrides:
+        elec_util = elec_util.model_copy(update=util_overrides)
 
     # If other end uses use the heating fuel, make an estimate of their annual
     # consumption of that fuel.  This figure is expressed in the physical unit
@@ -101,16 +106,16 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     # and Cooking).
     is_electric_heat = fuel.id == ELECTRIC_ID  # True if Electric
     fuel_other_uses = (
-        inp_bldg.exist_heat_system.serves_dhw * 4.23e6 / fuel.dhw_effic
+        exist_heat.serves_dhw * 4.23e6 / fuel.dhw_effic
     )  # per occupant value
-    fuel_other_uses += inp_bldg.exist_heat_system.serves_clothes_drying * (
+    fuel_other_uses += exist_heat.serves_clothes_drying * (
         0.86e6 if is_electric_heat else 2.15e6
     )
-    fuel_other_uses += inp_bldg.exist_heat_system.serves_cooking * (
+    fuel_other_uses += exist_heat.serves_cooking * (
         0.64e6 if is_electric_heat else 0.8e6
     )
     # convert from per occupant to total
-    fuel_other_uses *= inp_bldg.exist_heat_system.occupant_count
+    fuel_other_uses *= exist_heat.occupant_count
     # convert to fuel units
     fuel_other_uses /= fuel.btus
 
@@ -129,12 +134,12 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         # Remove the energy use from the other end uses that use the fuel, unless
         # this is electric heat and the user indicated that the entered value is
         # just space heating.
-        if is_electric_heat and inp.actual_fuel_use.annual_electric_is_just_space_heat:
+        if is_electric_heat and inp_actual.annual_electric_is_just_space_heat:
             # user explicitly indicated that the entered annual usage value is
             # just space heating.
-            space_fuel_use = inp.actual_fuel_use.secondary_fuel_units
+            space_fuel_use = inp_actual.secondary_fuel_units
         else:
-            space_fuel_use = inp.actual_fuel_use.secondary_fuel_units - fuel_other_uses
+            space_fuel_use = inp_actual.secondary_fuel_units - fuel_other_uses
             if is_electric_heat:
                 # if electric heat, also need to subtract out other lights and appliances
                 space_fuel_use -= lights_other_elec
@@ -152,13 +157,14 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         ua_true_up = 1.0
 
     # Set the UA true up value into the model and also add it to the miscellaneous results.
-    inp_bldg.ua_true_up = ua_true_up
+    # The changed inputs are shallow copies made with the changes applied, so the
+    # caller's input object is not modified.
+    inp_bldg = inp_bldg.model_copy(update={"ua_true_up": ua_true_up})
     misc_res["ua_true_up"] = ua_true_up
 
     # Run the base case with no heat pump and record energy results.
     # This model only models the space heating end use.
-    bldg_no_hp = inp_bldg.model_copy()
-    bldg_no_hp.heat_pump = None
+    bldg_no_hp = inp_bldg.model_copy(update={"heat_pump": None})
     en_base = model_space_heat(bldg_no_hp)
     res["base_case_detail"] = en_base
 
@@ -169,13 +175,14 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     # Calculate some summary measures
 
     # CO2 savings. If secondary fuel is electric, fuel.co2 is None, so protect against that.
+    fuel_co2 = chg_nonnum(fuel.co2, 0.0)
     co2_base = (
         en_base.annual_results.space_heat_kwh * elec_util.CO2
-        + en_base.annual_results.secondary_fuel_mmbtu * chg_nonnum(fuel.co2, 0.0)
+        + en_base.annual_results.secondary_fuel_mmbtu * fuel_co2
     )
     co2_hp = (
         en_hp.annual_results.space_heat_kwh * elec_util.CO2
-        + en_hp.annual_results.secondary_fuel_mmbtu * chg_nonnum(fuel.co2, 0.0)
+        + en_hp.annual_results.secondary_fuel_mmbtu * fuel_co2
     )
     misc_res["co2_lbs_saved"] = co2_base - co2_hp
     misc_res["co2_driving_miles_saved"] = convert_co2_to_miles_driven(
@@ -210,6 +217,16 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
 
     else:
         # Electric Heat Case
+
+        # Monthly kWh for the DHW, Clothes Drying and Cooking end uses, assuming flat
+        # use through the year, and for lights and other misc. appliances, which have
+        # some monthly variation given by LIGHTS_OTHER_PAT.  These are numpy arrays
+        # because DAYS_IN_MONTH is an array.
+        other_uses_kwh = fuel_other_uses / 8760.0 * DAYS_IN_MONTH * 24.0
+        lights_other_kwh = (
+            lights_other_elec / 8760.0 * LIGHTS_OTHER_PAT * DAYS_IN_MONTH * 24.0
+        )
+
         if inp_actual.electric_use_by_month:
             # actual use by month was provided
             dfb["all_kwh"] = inp_actual.electric_use_by_month.copy()
@@ -225,16 +242,10 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
                     all_kwh = scaler * dfb.space_heat_kwh.values
 
                     # add in any DHW, Clothes Drying and Cooking provided by electricity.
-                    all_kwh += fuel_other_uses / 8760.0 * DAYS_IN_MONTH * 24.0
+                    all_kwh += other_uses_kwh
 
                     # add in lights and other misc. appliances, with some monthly variation.
-                    all_kwh += (
-                        lights_other_elec
-                        / 8760.0
-                        * LIGHTS_OTHER_PAT
-                        * DAYS_IN_MONTH
-                        * 24.0
-                    )
+                    all_kwh += lights_other_kwh
 
                 else:
                     # provided value is total electric kWh.  Scale modeled values of space heat,
@@ -245,16 +256,10 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
                     all_kwh = dfb.space_heat_kwh.values.copy()
 
                     # add in any DHW, Clothes Drying and Cooking provided by electricity.
-                    all_kwh += fuel_other_uses / 8760.0 * DAYS_IN_MONTH * 24.0
+                    all_kwh += other_uses_kwh
 
                     # add in lights and other misc. appliances, with some monthly variation.
-                    all_kwh += (
-                        lights_other_elec
-                        / 8760.0
-                        * LIGHTS_OTHER_PAT
-                        * DAYS_IN_MONTH
-                        * 24.0
-                    )
+                    all_kwh += lights_other_kwh
 
                     # scale to provided annual total
                     scaler = inp_actual.secondary_fuel_units / all_kwh.sum()
@@ -268,14 +273,11 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
                 all_kwh = dfb.space_heat_kwh.values.copy()
 
                 # DHW, Clothes Drying and Cooking.  Assume flat use through year.
-                # This is a numpy array because DAYS_IN_MONTH is an array.
-                all_kwh += fuel_other_uses / 8760.0 * DAYS_IN_MONTH * 24.0
+                all_kwh += other_uses_kwh
 
                 # Now lights and other misc. appliances. Some monthly variation, given
                 # by LIGHTS_OTHER_PAT.
-                all_kwh += (
-                    lights_other_elec / 8760.0 * LIGHTS_OTHER_PAT * DAYS_IN_MONTH * 24.0
-                )
+                all_kwh += lights_other_kwh
 
             # store results
             dfb["all_kwh"] = all_kwh
@@ -294,10 +296,10 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     elec_cost_calc = ElecCostCalc(
         elec_util, sales_tax=sales_tax, pce_limit=inp_econ.pce_limit
     )
-    # cost function that will be applied to each row of the cost DataFrame
-    cost_func = lambda r: elec_cost_calc.monthly_cost(r.all_kwh, r.all_kw_max)
-
-    dfb["all_elec_dol"] = dfb.apply(cost_func, axis=1)
+    # monthly_cost() calculates the costs for all months at once.
+    dfb["all_elec_dol"] = elec_cost_calc.monthly_cost(
+        dfb.all_kwh.values, dfb.all_kw_max.values
+    )
 
     if not is_electric_heat:
         # Now fuel use by month.  Remember that the home heat model only looked at
@@ -305,10 +307,12 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         # that use this fuel.
         fuel_price = chg_nonnum(
             inp_econ.fuel_price_override,
-            lib.fuel_price(inp_bldg.exist_heat_system.heat_fuel_id, city.id).price,
+            lib.fuel_price(exist_heat.heat_fuel_id, city.id).price,
         )
+        # fuel price including sales tax, used for both cases
+        fuel_price_taxed = fuel_price * (1.0 + sales_tax)
         dfb["fuel_units"] = dfb.secondary_fuel_units + fuel_other_uses / 12.0
-        dfb["fuel_dol"] = dfb.fuel_units * fuel_price * (1.0 + sales_tax)
+        dfb["fuel_dol"] = dfb.fuel_units * fuel_price_taxed
 
     else:
         # Electric Heat, so no secondary fuel
@@ -325,12 +329,14 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     dfh["all_kwh"] = dfb["all_kwh"] + extra_kwh
     extra_kw = (dfh.space_heat_kw_max - dfb.space_heat_kw_max).values
     dfh["all_kw_max"] = dfb["all_kw_max"] + extra_kw
-    dfh["all_elec_dol"] = dfh.apply(cost_func, axis=1)
+    dfh["all_elec_dol"] = elec_cost_calc.monthly_cost(
+        dfh.all_kwh.values, dfh.all_kw_max.values
+    )
 
     # Now fuel, including other end uses using the heating fuel
     if not is_electric_heat:
         dfh["fuel_units"] = dfh.secondary_fuel_units + fuel_other_uses / 12.0
-        dfh["fuel_dol"] = dfh.fuel_units * fuel_price * (1.0 + sales_tax)
+        dfh["fuel_dol"] = dfh.fuel_units * fuel_price_taxed
 
     else:
         # Electric Heat, so no secondary fuel
@@ -391,7 +397,9 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
 
     # ---------------- Cash Flow Analysis
 
-    # List of cash flow items
+    # List of cash flow items. All of the values used to build these items come
+    # from validated models or are calculated here, so the items are built with
+    # model_construct() to skip validation.
     cash_flow_items = []
 
     # Initial year impacts
@@ -400,7 +408,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     if frac_fin > 0.0:
         # Loan is being used. Fraction financed applies to full heat pump cost.
         cash_flow_items.append(
-            InitialAmount(
+            InitialAmount.model_construct(
                 label="Heat Pump Downpayment", amount=-(1.0 - frac_fin) * hp_cost
             )
         )
@@ -408,7 +416,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         loan_pmt = npf.pmt(inp_hpc.loan_interest, inp_hpc.loan_term, hp_cost * frac_fin)
         # above function produces negative number already
         cash_flow_items.append(
-            EscalatingFlow(
+            EscalatingFlow.model_construct(
                 label="Loan Payment",
                 amount=loan_pmt,
                 escalation_rate=0.0,
@@ -416,10 +424,12 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
             )
         )
     else:
-        cash_flow_items.append(InitialAmount(label="Heat Pump Cost", amount=-hp_cost))
+        cash_flow_items.append(
+            InitialAmount.model_construct(label="Heat Pump Cost", amount=-hp_cost)
+        )
     if inp_hpc.rebate_amount > 0.0:
         cash_flow_items.append(
-            InitialAmount(label="Rebate", amount=inp_hpc.rebate_amount)
+            InitialAmount.model_construct(label="Rebate", amount=inp_hpc.rebate_amount)
         )
 
     # Electricity cost impacts
@@ -427,7 +437,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     if type(inp_econ.elec_rate_forecast) == float:
         # escalation rate
         cash_flow_items.append(
-            EscalatingFlow(
+            EscalatingFlow.model_construct(
                 label="Electricity Cost",
                 amount=-ann_chg.all_elec_dol,
                 escalation_rate=inp_econ.elec_rate_forecast,
@@ -437,7 +447,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         # A price pattern was provided, but the provided pattern starts at Year 1.
         # Add a Year 0 value.
         cash_flow_items.append(
-            PatternFlow(
+            PatternFlow.model_construct(
                 label="Electricity Cost",
                 amount=-ann_chg.all_elec_dol,
                 pattern=[0.0] + inp_econ.elec_rate_forecast,
@@ -450,7 +460,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
         if type(inp_econ.fuel_price_forecast) == float:
             # escalation rate
             cash_flow_items.append(
-                EscalatingFlow(
+                EscalatingFlow.model_construct(
                     label="Fuel Cost",
                     amount=-ann_chg.fuel_dol,
                     escalation_rate=inp_econ.fuel_price_forecast,
@@ -460,7 +470,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
             # A price pattern was provided, but the provided pattern starts at Year 1.
             # Add a Year 0 value.
             cash_flow_items.append(
-                PatternFlow(
+                PatternFlow.model_construct(
                     label="Fuel Cost",
                     amount=-ann_chg.fuel_dol,
                     pattern=[0.0] + inp_econ.fuel_price_forecast,
@@ -469,7 +479,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
 
     # include the operating cost change
     cash_flow_items.append(
-        EscalatingFlow(
+        EscalatingFlow.model_construct(
             label="Operating Cost Change",
             amount=-inp_hpc.op_cost_chg,
             escalation_rate=inp_econ.inflation_rate,
@@ -477,7 +487,7 @@ def analyze_heat_pump(inp: HeatPumpAnalysisInputs) -> HeatPumpAnalysisResults:
     )
 
     # Analyze the cash flows
-    econ_inp = CashFlowInputs(
+    econ_inp = CashFlowInputs.model_construct(
         duration=inp_hpc.heat_pump_life,
         discount_rate=inp_econ.discount_rate,
         cash_flow_items=cash_flow_items,
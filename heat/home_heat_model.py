@@ -2,6 +2,9 @@
 energy use of the home either with or without the heat pump.
 """
 
+import collections
+import functools
+import threading
 from typing import Tuple
 
 import numpy as np
@@ -13,6 +16,7 @@ from .models import (
     DetailedModelResults,
     WallInsulLevel,
     TemperatureTolerance,
+    HSPFtype,
 )
 from .hspf_convert import convert_to_hspf
 from library import library as lib
@@ -62,10 +66,11 @@ COP_vs_TEMP = (
     (61.0, 3.16),
 )
 
-# convert to separate lists of temperatures and COPs
-TEMPS_FIT, COPS_FIT = tuple(zip(*COP_vs_TEMP))
-TEMPS_FIT = np.array(TEMPS_FIT)
-COPS_FIT = np.array(COPS_FIT)
+# convert to separate arrays of temperatures and COPs. These are shared by all
+# model runs, so make them read-only.
+TEMPS_FIT, COPS_FIT = np.array(COP_vs_TEMP, dtype=np.float64).T.copy()
+TEMPS_FIT.setflags(write=False)
+COPS_FIT.setflags(write=False)
 
 # The HSPF value that this curve is associated with.  This is the average of the HSPFs
 # for the studies used to create the above COP vs. Temperature curve.  See the above
@@ -76,6 +81,98 @@ BASE_HSPF = 11.33
 
 GARAGE_HEATING_SETPT = 55.0  # deg F
 
+MMBTU_PER_KWH = 0.003412  # energy content of a kWh
+
+# Temperature depression of rooms adjacent to the heat pump space, deg F, that is
+# tolerable for each bedroom temperature tolerance level.
+TEMP_DEPRESS_TOLERANCE = {
+    TemperatureTolerance.low: 2.0,
+    TemperatureTolerance.med: 5.0,
+    TemperatureTolerance.high: 10.0,
+}
+
+
+def interp_points(x, xp):
+    """Returns the indexes and weights needed to linearly interpolate curves defined
+    at the increasing points 'xp' to the values in 'x'. The value of a curve 'fp' at
+    'x' is then fp[i] + w * (fp[i + 1] - fp[i]). As with np.interp(), values of 'x'
+    outside the range of 'xp' take the value at the nearest end. Useful when several
+    curves share the same 'xp', as the search for the points is done only once.
+    """
+    i = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    w = np.clip((x - xp[i]) / (xp[i + 1] - xp[i]), 0.0, 1.0)
+    return i, w
+
+
+@functools.lru_cache(maxsize=50)
+def tmy_arrays(
+    tmy_id: int, data_timestamp: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the hourly arrays needed by the model from the TMY data for the site
+    'tmy_id': the dry-bulb temperatures, the months (1 = January), and the index
+    of the first hour of each month (the TMY hours are in calendar order), for the
+    library data of 'data_timestamp'. These are the same for every model run at the
+    site, so are cached.
+    """
+    # Use the cached TMY DataFrame columns directly rather than the list-based
+    # TMYdataset, which is only needed for the API.
+    df_tmy = lib.tmy_df_from_id(tmy_id)
+    # Fill any missing temperatures from the neighboring hours so that a gap in the
+    # TMY data doesn't make the loads and monthly totals NaN.
+    db_temp = df_tmy.db_temp.interpolate(limit_direction="both").to_numpy(
+        dtype=float, copy=True
+    )
+    month = df_tmy.month.to_numpy(dtype=int, copy=True)
+    month_starts = np.searchsorted(month, np.arange(1, 13))
+    for arr in (db_temp, month, month_starts):
+        arr.setflags(write=False)
+    return db_temp, month, month_starts
+
+
+@functools.lru_cache(maxsize=256)
+def heat_pump_curves(
+    hspf: float, hspf_type: HSPFtype, indoor_heat_setpoint: float, max_out_5f: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the outdoor temperature points, and the COP and maximum output
+    (BTU/hour) at those points, for a heat pump with an HSPF of 'hspf' (of type
+    'hspf_type') and a maximum output of 'max_out_5f' at 5 deg F, heating a home
+    with an indoor setpoint of 'indoor_heat_setpoint'. The curves only depend on
+    these few values, so are cached.
+    """
+    # Create an adjusted COP curve that accounts for the actual HSPF of
+    # this heat pump. Adjust the COP of this unit by ratioing it to the
+    # average HSPF of the units used to determine the baseline COP vs. Temperature
+    # curve.  Because of the weak correlation of HSPF to actual performance,
+    # the HSPF adjustment here is not linear, but instead dampened by raising
+    # the ratio to the 0.5 power.  This was a judgement call.
+
+    # Convert other HSPF values into old HSPF
+    hspf_old = convert_to_hspf(hspf, hspf_type)
+
+    cops_fit_adj = COPS_FIT * (hspf_old / BASE_HSPF) ** 0.5
+
+    # Also adjust the associated outdoor temperature points to account for the fact
+    # that the indoor temperature setpoint does not equal the 70 degree F
+    # temperature average from the field studies that developed the COP curve.
+    temps_fit_adj = TEMPS_FIT + (indoor_heat_setpoint - 70.0)
+
+    # Now determine the maximum output of the heat pump at each temperature point.
+    # Do this by trusting the manufacturer's max output at 5 deg F. Use COP ratios
+    # to adjust from that value.
+    # First get the COP that is associated with the 5 deg F value. This value was
+    # associated with an indoor temperature of 70 deg F, so use the original temperature
+    # curve.
+    cop5F_70F = np.interp(5.0, TEMPS_FIT, cops_fit_adj)
+
+    # Make an array that is the max output at each of the adjusted temperature
+    # points, by ratioing the COPs off this COP. The scalar factors are combined
+    # first so the array is only multiplied once.
+    max_hp_output_fit_adj = cops_fit_adj * (max_out_5f / cop5F_70F)
+
+    for arr in (temps_fit_adj, cops_fit_adj, max_hp_output_fit_adj):
+        arr.setflags(write=False)
+    return temps_fit_adj, cops_fit_adj, max_hp_output_fit_adj
+
 
 def temp_depression(ua_per_ft2, balance_point, outdoor_temp, doors_open):
     """Function returns the number of degrees F cooler that the bedrooms are
@@ -90,11 +187,14 @@ def temp_depression(ua_per_ft2, balance_point, outdoor_temp, doors_open):
         for the building.  It is measured as Btu/hour/deg-F/ft2
     'balance_point': is the balance point temperature (deg F) for the building; an outdoor
         temperature above which no heat needs to be supplied to the building.
-    'outdoor_temp': the outdoor temperature, deg F.
+    'outdoor_temp': the outdoor temperature, deg F. This can be a NumPy array, e.g. of
+        hourly temperatures, in which case an array of depressions is returned.
     'doors_open': True if the doors between the main space and the bedroom are open,
         False if they are closed.
     """
 
+    # the resistance depends only on 'doors_open', so the calculation below is pure
+    # arithmetic that works on scalars and arrays alike.
     r_to_bedroom = 0.424 if doors_open else 1.42
     temp_delta = balance_point - outdoor_temp
     temp_depress = temp_delta * r_to_bedroom / (r_to_bedroom + 1.0 / ua_per_ft2)
@@ -117,11 +217,41 @@ def design_heat_load(self) -> Tuple[float, float]:
 
 # ---------------- Main Calculation Method --------------------
 
+# Results of recent model_space_heat() calls, keyed by the JSON of the inputs and
+# the library data time, most recently used last. The routes run in FastAPI's
+# threadpool, so access is done while holding the lock.
+MODEL_CACHE_SIZE = 256
+_model_cache = collections.OrderedDict()
+_model_cache_lock = threading.Lock()
+
 
 def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
     """Main calculation routine that models the home and determines
     loads and fuel use by hour.  Also calculates summary results.
+
+    The same building is often modeled repeatedly, e.g. the UA true up and the
+    no heat pump case when comparing several heat pumps for one home, so results
+    are cached. Each call returns its own copy of the results.
     """
+    key = (inp.model_dump_json(), lib.last_lib_download_ts)
+    with _model_cache_lock:
+        result = _model_cache.get(key)
+        if result is not None:
+            _model_cache.move_to_end(key)
+
+    if result is None:
+        result = _model_space_heat(inp)
+        with _model_cache_lock:
+            _model_cache[key] = result
+            if len(_model_cache) > MODEL_CACHE_SIZE:
+                _model_cache.popitem(last=False)
+
+    # copy so callers can't change the cached results
+    return result.model_copy(deep=True)
+
+
+def _model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
+    """Does the modeling for model_space_heat(), without caching."""
     # Results dictionary
     res = {}
 
@@ -129,75 +259,48 @@ def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
     city = lib.city_from_id(inp.city_id)
     exist_heat_fuel = lib.fuel_from_id(inp.exist_heat_system.heat_fuel_id)
 
-    # ------ Make a DataFrame with hourly input information
-    # Do as much processing at this level using array operations, as
-    # opposed to processing within the hourly loop further below.
+    # ------ Get arrays of hourly input information
+    # All of the hourly processing is done with NumPy array operations; a DataFrame
+    # is only made when the hourly results are summarized by month.
 
-    tmy_site = lib.tmy_from_id(city.TMYid)
-    df_tmy = pd.DataFrame(tmy_site.hourly_data)
-    dfh = df_tmy[["db_temp", "month"]].copy()
-    dfh["day_of_year"] = [i for i in range(1, 366) for _ in range(24)]
+    db_temp, month, month_starts = tmy_arrays(city.TMYid, lib.last_lib_download_ts)
 
     if inp.heat_pump is not None:
         # Determine days that the heat pump is running.  Look at the 20th percentile
         # temperature for the day, and ensure that it is above the low
         # temperature cutoff.
-        hp_is_running = lambda x: (x.quantile(0.2) > inp.heat_pump.low_temp_cutoff)
-        dfh["running"] = dfh.groupby("day_of_year")["db_temp"].transform(hp_is_running)
+        # The TMY data has 365 days of 24 hours, so reshape into one row per day.
+        day_temp_q20 = np.quantile(db_temp.reshape(365, 24), 0.2, axis=1)
+        running = np.repeat(day_temp_q20 > inp.heat_pump.low_temp_cutoff, 24)
 
         # Also consider whether the user has selected the month as an Off month.
         if inp.heat_pump.off_months is not None:
-            off_mask = dfh.month.isin(inp.heat_pump.off_months)
-            dfh.loc[off_mask, "running"] = False
-
-        # Create an adjusted COP curve that accounts for the actual HSPF of
-        # this heat pump. Adjust the COP of this unit by ratioing it to the
-        # average HSPF of the units used to determine the baseline COP vs. Temperature
-        # curve.  Because of the weak correlation of HSPF to actual performance,
-        # the HSPF adjustment here is not linear, but instead dampened by raising
-        # the ratio to the 0.5 power.  This was a judgement call.
-
-        # Convert other HSPF values into old HSPF
-        hspf_old = convert_to_hspf(inp.heat_pump.hspf, inp.heat_pump.hspf_type)
-
-        cops_fit_adj = COPS_FIT * (hspf_old / BASE_HSPF) ** 0.5
-
-        # Also adjust the associated outdoor temperature points to account for the fact
-        # that the indoor temperature setpoint does not equal the 70 degree F
-        # temperature average from the field studies that developed the COP curve.
-        temps_fit_adj = TEMPS_FIT + (inp.indoor_heat_setpoint - 70.0)
+            running &= ~np.isin(month, inp.heat_pump.off_months)
 
+        # COP and maximum output curves for this heat pump and indoor setpoint.
         # Note that this same COP curve is used if the garage is heated by the heat pump
         # because heatpump condenser temperature will be set by the home indoor setpoint,
         # even though the garage runs at a cooler temperature
+        temps_fit_adj, cops_fit_adj, max_hp_output_fit_adj = heat_pump_curves(
+            inp.heat_pump.hspf,
+            inp.heat_pump.hspf_type,
+            inp.indoor_heat_setpoint,
+            inp.heat_pump.max_out_5f,
+        )
 
-        dfh["cop"] = np.interp(dfh.db_temp, temps_fit_adj, cops_fit_adj)
-
-        # Now determine the maximum output of the heat pump at each temperature point.
-        # Do this by trusting the manufacturer's max output at 5 deg F. Use COP ratios
-        # to adjust from that value.
-        # First get the COP that is associated with the 5 deg F value. This value was
-        # associated with an indoor temperature of 70 deg F, so use the original temperature
-        # curve.
-        cop5F_70F = np.interp(5.0, TEMPS_FIT, cops_fit_adj)
-
-        # Now make a multiplier array that ratios off this COP
-        capacity_mult = cops_fit_adj / cop5F_70F
-
-        # Make an array that is the max output at each of the adjusted temperature
-        # points.
-        max_hp_output_fit_adj = capacity_mult * inp.heat_pump.max_out_5f
+        # The COP and maximum output curves share the same temperature points, so
+        # locate the hourly temperatures on that curve once.
+        i_fit, w_fit = interp_points(db_temp, temps_fit_adj)
+        cop = cops_fit_adj[i_fit] + w_fit * np.diff(cops_fit_adj)[i_fit]
 
         # Make an hourly array of maximum heat pump output, BTU/hour
-        dfh["max_hp_output"] = np.interp(
-            dfh.db_temp, temps_fit_adj, max_hp_output_fit_adj
+        max_hp_output = (
+            max_hp_output_fit_adj[i_fit] + w_fit * np.diff(max_hp_output_fit_adj)[i_fit]
         )
 
     else:
         # No heat pump installed
-        dfh["running"] = False
-        dfh["cop"] = 1.0  # filler value
-        dfh["max_hp_output"] = 0.0
+        cop = 1.0  # filler value
 
     # adjustment to UA for insulation level.  My estimate, accounting
     # for better insulation *and* air-tightness as you move up the
@@ -217,150 +320,155 @@ def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
     # Determined this UA/ft2 below by modeling a typical Enstar home
     # and having the model estimate space heating use of about 1250 CCF.
     # See 'accessible_UA.ipynb'.
-    ua_per_ft2 = 0.189
-    ua_home = ua_per_ft2 * ua_insul_adj * inp.bldg_floor_area * inp.ua_true_up
+    # The insulation and true up adjustments are combined once, as they are used
+    # for the UA values and for the balance points.
+    ua_adj = ua_insul_adj * inp.ua_true_up
+    ua_per_ft2 = 0.189 * ua_adj  # adjusted UA / ft2 of this home
+    ua_home = ua_per_ft2 * inp.bldg_floor_area
     garage_area = (0, 14 * 22, 22 * 22, 36 * 25, 48 * 28)[inp.garage_stall_count]
-    ua_garage = ua_per_ft2 * 1.1 * ua_insul_adj * garage_area * inp.ua_true_up
+    ua_garage = ua_per_ft2 * 1.1 * garage_area
 
     # Balance Points of main home and garage
     # Assume a 10 deg F internal/solar heating effect for Level 2 insulation
     # in the main home and a 5 deg F heating effect in the garage.
     # Adjust the heating effect accordingly for other levels of insulation.
-    balance_point_home = inp.indoor_heat_setpoint - 10.0 / ua_insul_adj / inp.ua_true_up
+    balance_point_home = inp.indoor_heat_setpoint - 10.0 / ua_adj
 
     # fewer internal/solar in garage
-    balance_point_garage = GARAGE_HEATING_SETPT - 5.0 / ua_insul_adj / inp.ua_true_up
+    balance_point_garage = GARAGE_HEATING_SETPT - 5.0 / ua_adj
+
+    # Calculate the hourly loads with array operations.
+
+    # calculate total heat load for each hour.
+    # Really need to recognize that delta-T to outdoors is lower in the adjacent and remote spaces
+    # if there heat pump is the only source of heat. But, I'm saving that for later work.
+    home_load = np.maximum(0.0, balance_point_home - db_temp) * ua_home
+    garage_load = np.maximum(0.0, balance_point_garage - db_temp) * ua_garage
+    total_load = home_load + garage_load
+
+    if inp.heat_pump is not None:
+        # Build up the possible heat pump load, and then limit it to
+        # maximum available from the heat pump.
+
+        # Start with all of the load in the spaces exposed to heat pump indoor
+        # units.
+        hp_ld = home_load * inp.heat_pump.frac_exposed_to_hp
+
+        # Then, garage load if it is heated by the heat pump
+        hp_ld += garage_load * inp.heat_pump.serves_garage
+
+        # For the spaces adjacent to the space heated directly by the heat pump,
+        # first calculate how much cooler those spaces would be without direct
+        # heat.
+        temp_depress = temp_depression(
+            ua_per_ft2,
+            balance_point_home,
+            db_temp,
+            inp.heat_pump.doors_open_to_adjacent,
+        )
+        # determine the temp depression tolerance in deg F
+        temp_depress_tolerance = TEMP_DEPRESS_TOLERANCE[
+            inp.heat_pump.bedroom_temp_tolerance
+        ]
+        # if depression is less than this, include the load
+        # I'm not diminishing the load here for smaller delta-T.  It's possible
+        # the same diminished delta-T was present in the base case (point-source
+        # heating system).  Probably need to refine this.
+        hp_ld += np.where(
+            temp_depress <= temp_depress_tolerance,
+            home_load * inp.heat_pump.frac_adjacent_to_hp,
+            0.0,
+        )
+
+        # limit the heat pump load to its capacity at this temperature
+        hp_ld = np.minimum(hp_ld, max_hp_output)
+
+        # The heat pump only carries load in the hours it is running.
+        hp_load = np.where(running, hp_ld, 0.0)
+
+        # record the fraction of the heat pump capacity being used.
+        hp_capacity_used = np.divide(
+            hp_ld, max_hp_output, out=np.zeros(len(hp_ld)), where=running
+        )
+
+    else:
+        hp_load = np.zeros(len(db_temp))
+        hp_capacity_used = np.zeros(len(db_temp))
 
     # BTU loads in the hour for the heat pump and for the secondary system.
-    hp_load = []
-    secondary_load = []
-
-    # More complicated calculations are done in this hourly loop.  If processing
-    # time becomes a problem, try to convert the calculations below into array
-    # operations that can be done outside the loop.
-
-    hp_capacity_used = []  # fraction of heat pump capacity used in each hour
-
-    for h in dfh.itertuples():
-        # calculate total heat load for the hour.
-        # Really need to recognize that delta-T to outdoors is lower in the adjacent and remote spaces
-        # if there heat pump is the only source of heat. But, I'm saving that for later work.
-        home_load = max(0.0, balance_point_home - h.db_temp) * ua_home
-        garage_load = max(0.0, balance_point_garage - h.db_temp) * ua_garage
-        total_load = home_load + garage_load
-        if not h.running:
-            hp_load.append(0.0)
-            secondary_load.append(total_load)
-            hp_capacity_used.append(0.0)
-        else:
-            # Build up the possible heat pump load, and then limit it to
-            # maximum available from the heat pump.
-
-            # Start with all of the load in the spaces exposed to heat pump indoor
-            # units.
-            hp_ld = home_load * inp.heat_pump.frac_exposed_to_hp
-
-            # Then, garage load if it is heated by the heat pump
-            hp_ld += garage_load * inp.heat_pump.serves_garage
-
-            # For the spaces adjacent to the space heated directly by the heat pump,
-            # first calculate how much cooler those spaces would be without direct
-            # heat.
-            temp_depress = temp_depression(
-                ua_home / inp.bldg_floor_area,
-                balance_point_home,
-                h.db_temp,
-                inp.heat_pump.doors_open_to_adjacent,
-            )
-            # determine the temp depression tolerance in deg F
-            temp_depress_tolerance = {
-                TemperatureTolerance.low: 2.0,
-                TemperatureTolerance.med: 5.0,
-                TemperatureTolerance.high: 10.0,
-            }[inp.heat_pump.bedroom_temp_tolerance]
-            # if depression is less than this, include the load
-            if temp_depress <= temp_depress_tolerance:
-                # I'm not diminishing the load here for smaller delta-T.  It's possible
-                # the same diminished delta-T was present in the base case (point-source
-                # heating system).  Probably need to refine this.
-                hp_ld += home_load * inp.heat_pump.frac_adjacent_to_hp
-
-            # limit the heat pump load to its capacity at this temperature
-            hp_ld = min(hp_ld, h.max_hp_output)
-
-            hp_load.append(hp_ld)
-            secondary_load.append(total_load - hp_ld)
-
-            # record the fraction of the heat pump capacity being used.
-            hp_capacity_used.append(hp_ld / h.max_hp_output)
-
-    dfh["hp_load_mmbtu"] = np.array(hp_load) / 1e6
-    dfh["secondary_load_mmbtu"] = np.array(secondary_load) / 1e6
-    dfh["hp_capacity_used"] = hp_capacity_used
+    hp_load_mmbtu = hp_load / 1e6
+    secondary_load_mmbtu = (total_load - hp_load) / 1e6
 
     # reduce the secondary load to account for the heat produced by
     # the auxiliary electricity use.
     # convert the auxiliary heat factor for the secondary heating system into an
     # energy ratio of aux electricity energy to heat delivered.
-    aux_ratio = inp.exist_heat_system.aux_elec_use * 0.003412
-    dfh["secondary_load_mmbtu"] /= 1.0 + aux_ratio
+    aux_ratio = inp.exist_heat_system.aux_elec_use * MMBTU_PER_KWH
+    secondary_load_mmbtu /= 1.0 + aux_ratio
 
     # using array operations, calculate kWh use by the heat pump and
     # the Btu use of secondary system.
-    dfh["hp_kwh"] = dfh.hp_load_mmbtu / dfh.cop / 0.003412
-    dfh["secondary_fuel_mmbtu"] = (
-        dfh.secondary_load_mmbtu / inp.exist_heat_system.heating_effic
-    )
-    dfh["secondary_kwh"] = (
-        dfh.secondary_load_mmbtu * inp.exist_heat_system.aux_elec_use
+    hp_kwh = hp_load_mmbtu / cop / MMBTU_PER_KWH
+    secondary_fuel_mmbtu = secondary_load_mmbtu / inp.exist_heat_system.heating_effic
+    secondary_kwh = (
+        secondary_load_mmbtu * inp.exist_heat_system.aux_elec_use
     )  # auxiliary electric use
 
     # if this is electric heat as the secondary fuel, move the secondary fuel use into
     # the secondary kWh column and blank out the secondary fuel MMBtu.
     if inp.exist_heat_system.heat_fuel_id == ELECTRIC_ID:
-        dfh.secondary_kwh += dfh.secondary_fuel_mmbtu * 1e6 / exist_heat_fuel.btus
-        dfh["secondary_fuel_mmbtu"] = 0.0
+        secondary_kwh += secondary_fuel_mmbtu * 1e6 / exist_heat_fuel.btus
+        secondary_fuel_mmbtu = np.zeros(len(db_temp))
 
-    # Make a column for total kWh.  Do this at the hourly level because it is
+    # Make an array for total kWh.  Do this at the hourly level because it is
     # needed to accurately account for coincident peak demand.
-    dfh["space_heat_kwh"] = dfh.hp_kwh + dfh.secondary_kwh
-
-    # Store annual and monthly totals.
-    # Annual totals is a Pandas Series.
-    total_cols = [
-        "hp_load_mmbtu",
-        "secondary_load_mmbtu",
-        "hp_kwh",
-        "secondary_fuel_mmbtu",
-        "secondary_kwh",
-        "space_heat_kwh",
-    ]
-    dfm = dfh.groupby("month")[total_cols].sum()
+    space_heat_kwh = hp_kwh + secondary_kwh
+
+    # Store monthly totals, summing the hourly values with bincount. The TMY hours
+    # are in calendar order, so each month is a contiguous block of hours starting
+    # at the index in 'month_starts'; those blocks are used to find monthly maximums.
+    month_ix = month - 1
+    hourly_totals = {
+        "hp_load_mmbtu": hp_load_mmbtu,
+        "secondary_load_mmbtu": secondary_load_mmbtu,
+        "hp_kwh": hp_kwh,
+        "secondary_fuel_mmbtu": secondary_fuel_mmbtu,
+        "secondary_kwh": secondary_kwh,
+        "space_heat_kwh": space_heat_kwh,
+    }
+    # Gather the monthly columns as arrays, then make the DataFrame once at the end.
+    mo = {
+        col: np.bincount(month_ix, weights=vals, minlength=12)
+        for col, vals in hourly_totals.items()
+    }
 
-    # Add a column for the fraction of the total heat load served by the heat pump.
-    dfm["hp_load_frac"] = dfm.hp_load_mmbtu / (
-        dfm.hp_load_mmbtu + dfm.secondary_load_mmbtu
-    )
+    # Months with no load or no heat pump use produce NaN ratios below, which is
+    # expected.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Add a column for the fraction of the total heat load served by the heat pump.
+        mo["hp_load_frac"] = mo["hp_load_mmbtu"] / (
+            mo["hp_load_mmbtu"] + mo["secondary_load_mmbtu"]
+        )
 
-    # Add a column for the fraction of heat pump capacity used, maximum across hours
-    dfm["hp_capacity_used_max"] = dfh.groupby("month")[["hp_capacity_used"]].max()
+        # Add a column for the fraction of heat pump capacity used, maximum across hours
+        mo["hp_capacity_used_max"] = np.maximum.reduceat(hp_capacity_used, month_starts)
 
-    # Add in columns for the peak electrical demand during the month
-    dfm["hp_kw_max"] = dfh.groupby("month")[["hp_kwh"]].max()
-    dfm["secondary_kw_max"] = dfh.groupby("month")[["secondary_kwh"]].max()
-    dfm["space_heat_kw_max"] = dfh.groupby("month")[
-        ["space_heat_kwh"]
-    ].max()  # can't add the above cuz of coincidence
+        # Add in columns for the peak electrical demand during the month
+        mo["hp_kw_max"] = np.maximum.reduceat(hp_kwh, month_starts)
+        mo["secondary_kw_max"] = np.maximum.reduceat(secondary_kwh, month_starts)
+        mo["space_heat_kw_max"] = np.maximum.reduceat(
+            space_heat_kwh, month_starts
+        )  # can't add the above cuz of coincidence
 
-    # physical units for secondary fuel
-    fuel = exist_heat_fuel  # shortcut variable
-    dfm["secondary_fuel_units"] = dfm["secondary_fuel_mmbtu"] * 1e6 / fuel.btus
+        # physical units for secondary fuel
+        fuel = exist_heat_fuel  # shortcut variable
+        mo["secondary_fuel_units"] = mo["secondary_fuel_mmbtu"] * 1e6 / fuel.btus
 
-    # COP by month
-    dfm["cop"] = dfm.hp_load_mmbtu / (dfm.hp_kwh * 0.003412)
+        # COP by month
+        mo["cop"] = mo["hp_load_mmbtu"] / (mo["hp_kwh"] * MMBTU_PER_KWH)
 
     # Add in a column to report the period being summarized
-    dfm["period"] = [
+    mo["period"] = [
         "Jan",
         "Feb",
         "Mar",
@@ -375,6 +483,8 @@ def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
         "Dec",
     ]
 
+    dfm = pd.DataFrame(mo, index=pd.Index(range(1, 13), name="month"))
+
     # Aggregate monthly results into annual results
     tot = monthly_to_annual_results(dfm)
 
@@ -383,7 +493,9 @@ def model_space_heat(inp: HeatModelInputs) -> DetailedModelResults:
     res["annual_results"] = nan_to_none(tot.to_dict())
 
     # Calculate and record design heating load information
-    design_t = tmy_site.site_info.heating_design_temp
+    design_t = lib.tmy_from_id(
+        city.TMYid, site_info_only=True
+    ).site_info.heating_design_temp
     res["design_heat_temp"] = design_t
     res["design_heat_load"] = ua_home * (
         inp.indoor_heat_setpoint - design_t
@@ -398,16 +510,14 @@ def determine_ua_true_up(
     """Returns a UA true up multiplier that causes the space heat model to match the actual space
     heating use of the home, which is passed in the 'secondary_fuel_use_actual' variable.
     """
-    # make a copy of the inputs to work with
-    inp = heat_model_inputs.model_copy()
+    # make a copy of the inputs to work with, removing the heat pump and setting
+    # the UA true up to 1.0. The inputs are already validated, so the changes are
+    # applied in the copy instead of assigning them afterwards.
+    inp = heat_model_inputs.model_copy(update={"heat_pump": None, "ua_true_up": 1.0})
 
     # set a flag indicating if this uses electric resistance as the existing space heat source
     is_electric = inp.exist_heat_system.heat_fuel_id == ELECTRIC_ID
 
-    # remove heat pump and set UA true to 1.0
-    inp.heat_pump = None
-    inp.ua_true_up = 1.0
-
     # model space heat use of the building
     res = model_space_heat(inp)
     # retrieve space heating fuel use expressed in fuel units (e.g. gallon)
@@ -418,8 +528,7 @@ def determine_ua_true_up(
 
     # scale the UA linearly to attempt to match the target fuel use
     ua_true_up = secondary_fuel_use_actual / fuel_use1
-    inp.ua_true_up = ua_true_up
-    res = model_space_heat(inp)
+    res = model_space_heat(inp.model_copy(update={"ua_true_up": ua_true_up}))
 
     if is_electric:
         # For electric heat, electric use for space heat is in secondary_kwh
@@ -447,25 +556,29 @@ def monthly_to_annual_results(df_monthly: pd.DataFrame) -> pd.Series:
     # then fix the ones that shouldn't be summed.
     annual = df_monthly[numeric_cols].sum()
 
-    # loop through the columns, fixing as needed
-    for col in numeric_cols:
-        if col in (
+    # the peak columns take the maximum across months instead, all in one reduction.
+    max_cols = [
+        col
+        for col in (
             "hp_kw_max",
             "secondary_kw_max",
             "space_heat_kw_max",
             "all_kw_max",
             "hp_capacity_used_max",
-        ):
-            annual[col] = df_monthly[col].max()
+        )
+        if col in numeric_cols
+    ]
+    annual[max_cols] = df_monthly[max_cols].max()
 
-        elif col == "hp_load_frac":
-            annual["hp_load_frac"] = annual.hp_load_mmbtu / (
-                annual.hp_load_mmbtu + annual.secondary_load_mmbtu
-            )
+    # the heat pump load fraction is recalculated from the annual loads.
+    if "hp_load_frac" in numeric_cols:
+        annual["hp_load_frac"] = annual.hp_load_mmbtu / (
+            annual.hp_load_mmbtu + annual.secondary_load_mmbtu
+        )
 
     # the 'cop' column may not be included in the numeric_cols list due to NaN, but it should be inlcuded
     if annual.hp_kwh > 0.0:
-        annual["cop"] = annual.hp_load_mmbtu / (annual.hp_kwh * 0.003412)
+        annual["cop"] = annual.hp_load_mmbtu / (annual.hp_kwh * MMBTU_PER_KWH)
     else:
         annual["cop"] = np.nan
 
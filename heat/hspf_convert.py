@@ -6,6 +6,8 @@ That notebook analyzed an October 2023 NEEP Heat Pump database, which
 contained thousands of heat pump units with HSPF and HSPF2 ratings.
 """
 
+import bisect
+
 import numpy as np
 
 from .models import HSPFtype
@@ -23,8 +25,23 @@ from_hspf2reg4_y = np.array([9.36, 9.55, 13.1, 14.5, 14.5 + 0.861 * 2.0])
 from_hspf2reg5_x = np.array([6.25, 7.25, 10.5, 11.25, 15.0])
 from_hspf2reg5_y = np.array([9.62, 10.1, 13.2, 13.6, 13.6 + 0.875 * 3.75])
 
-# Note that np.interp extends the endpoint y values for x values that are
-# outside the range of x-values in array.
+
+def _curve(x: np.ndarray, y: np.ndarray) -> tuple:
+    """Returns the points of a piecewise linear curve, and the slope of each of
+    its segments, as tuples of floats for fast scalar lookups.
+    """
+    return (
+        tuple(x.tolist()),
+        tuple(y.tolist()),
+        tuple((np.diff(y) / np.diff(x)).tolist()),
+    )
+
+
+# the conversion curves, keyed by the type of HSPF being converted
+conversion_curves = {
+    HSPFtype.hspf2_reg4: _curve(from_hspf2reg4_x, from_hspf2reg4_y),
+    HSPFtype.hspf2_reg5: _curve(from_hspf2reg5_x, from_hspf2reg5_y),
+}
 
 
 def convert_to_hspf(hspf_value: float, hspf_type: HSPFtype) -> float:
@@ -35,8 +52,13 @@ def convert_to_hspf(hspf_value: float, hspf_type: HSPFtype) -> float:
         # it is already the old-version HSPF
         return hspf_value
 
-    elif hspf_type == HSPFtype.hspf2_reg4:
-        return np.interp(hspf_value, from_hspf2reg4_x, from_hspf2reg4_y)
-
-    elif hspf_type == HSPFtype.hspf2_reg5:
-        return np.interp(hspf_value, from_hspf2reg5_x, from_hspf2reg5_y)
+    # Interpolate on the conversion curve. This gives the same result as np.interp,
+    # but without its overhead for a single value. Like np.interp, the endpoint y
+    # values are extended for x values outside the range of the curve.
+    xs, ys, slopes = conversion_curves[hspf_type]
+    if hspf_value <= xs[0]:
+        return ys[0]
+    if hspf_value >= xs[-1]:
+        return ys[-1]
+    i = bisect.bisect_right(xs, hspf_value) - 1
+    return ys[i] + slopes[i] * (hspf_value - xs[i])
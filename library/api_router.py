@@ -1,8 +1,14 @@
 """Defines the API for the Library functions."""
 
-from typing import List
+import functools
+import gzip
+import hashlib
+from typing import List, Tuple
 
-from fastapi import APIRouter
+import numpy as np
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from . import library as lib
 from general.models import Choice, Message
@@ -10,53 +16,105 @@ from library.models import City, Utility, Fuel, FuelPrice, TMYmeta, TMYdataset
 
 router = APIRouter()
 
+# The routes that return a single library object build the response themselves.
+# The library data is trusted, so there is no need for FastAPI to validate and
+# re-encode the object on the way out. The 'response_model' is still declared
+# so the API documentation describes the returned object.
+
+
+@functools.lru_cache(maxsize=8)
+def _list_json(list_func, data_timestamp) -> Tuple[bytes, bytes, str]:
+    """Returns the serialized JSON for the list of objects returned by the library
+    function 'list_func', a gzip compressed copy of that JSON, and a tag identifying
+    the content, for the library data of 'data_timestamp'.
+    """
+    body = orjson.dumps([item.model_dump() for item in list_func()])
+    body_gzip = gzip.compress(body, mtime=0)
+    tag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return body, body_gzip, tag
+
+
+def _list_response(list_func, request: Request) -> Response:
+    """Returns a response holding the cached JSON for a library list function,
+    already gzip compressed if the client accepts that. If the client already has
+    the content, as indicated by its If-None-Match header, an empty 304 Not Modified
+    response is returned instead.
+    """
+    body, body_gzip, tag = _list_json(list_func, lib.last_lib_download_ts)
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    # the two encodings of the content need different ETags
+    etag = f'"{tag}-gzip"' if use_gzip else f'"{tag}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        client_tags = [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = body_gzip
+    return Response(body, media_type="application/json", headers=headers)
+
 
 @router.get("/lib/cities", response_model=List[Choice], tags=["Library"])
-async def cities() -> List[Choice]:
-    return lib.cities()
+async def cities(request: Request) -> List[Choice]:
+    return _list_response(lib.cities, request)
 
 
 @router.get("/lib/cities/{city_id}", response_model=City, tags=["Library"])
 async def city(city_id: int) -> City:
-    # return loads(dumps(lib.city_from_id(city_id), ignore_nan=True))
-    return lib.city_from_id(city_id)
+    return ORJSONResponse(lib.city_from_id(city_id).model_dump())
 
 
 @router.get("/lib/utilities", response_model=List[Choice], tags=["Library"])
-async def utilities() -> List[Choice]:
-    return lib.utilities()
+async def utilities(request: Request) -> List[Choice]:
+    return _list_response(lib.utilities, request)
 
 
 @router.get("/lib/utilities/{utility_id}", response_model=Utility, tags=["Library"])
 async def utility(utility_id: int) -> Utility:
-    return lib.util_from_id(utility_id)
+    return ORJSONResponse(lib.util_from_id(utility_id).model_dump())
 
 
 @router.get("/lib/fuels", response_model=List[Choice], tags=["Library"])
-async def fuels() -> List[Choice]:
-    return lib.fuels()
+async def fuels(request: Request) -> List[Choice]:
+    return _list_response(lib.fuels, request)
 
 
 @router.get("/lib/fuels/{fuel_id}", response_model=Fuel, tags=["Library"])
 async def fuel(fuel_id: int) -> Fuel:
-    return lib.fuel_from_id(fuel_id)
+    return ORJSONResponse(lib.fuel_from_id(fuel_id).model_dump())
 
 
 @router.get(
     "/lib/fuelprice/{fuel_id}/{city_id}", response_model=FuelPrice, tags=["Library"]
 )
 async def fuel_price(fuel_id: int, city_id: int) -> FuelPrice:
-    return lib.fuel_price(fuel_id, city_id)
+    return ORJSONResponse(lib.fuel_price(fuel_id, city_id).model_dump())
 
 
 @router.get("/lib/tmys", response_model=List[TMYmeta], tags=["Library"])
-async def tmys() -> List[TMYmeta]:
-    return lib.tmys()
+async def tmys(request: Request) -> List[TMYmeta]:
+    return _list_response(lib.tmys, request)
 
 
 @router.get("/lib/tmys/{tmy_id}", response_model=TMYdataset, tags=["Library"])
 async def tmy(tmy_id: int, site_info_only: bool = False) -> TMYdataset:
-    return lib.tmy_from_id(tmy_id, site_info_only)
+    content = lib.tmy_from_id(tmy_id, site_info_only=True).model_dump()
+    if not site_info_only:
+        # Serialize the hourly columns directly from their NumPy arrays, which
+        # orjson encodes in C, instead of building Python lists of the values.
+        df_tmy = lib.tmy_df_from_id(tmy_id)
+        content["hourly_data"] = {
+            col: np.ascontiguousarray(df_tmy[col].to_numpy()) for col in df_tmy.columns
+        }
+    return ORJSONResponse(content)
 
 
 @router.get("/lib/refresh", response_model=Message, tags=["Library"])
@@ -0,0 +1,113 @@
+"""Reads the AkWarm Energy Library and TMY3 datasets from the remote server and
+the local 'data' directory, and saves and loads the prebuilt cache of them. This
+module has no import side effects, so scripts like bin/build_library_cache.py can
+use it without starting the library refresh thread.
+"""
+
+import os
+import io
+import pickle
+import urllib
+import time
+
+import pandas as pd
+import requests
+
+# Most of the data files are located remotely and are retrieved via
+# an HTTP request.
+# The base URL to the site where the remote files are located
+base_url = "https://github.com/alanmitchell/akwlib-export/raw/main/data/v01/"
+
+# Directory where the local data files are located
+data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+
+# Prebuilt copy of the library datasets, made by bin/build_library_cache.py.
+CACHE_PATH = os.path.join(data_dir, "library_cache.pkl")
+
+# This constant controls how frequently the library goes back to the GitHub server to
+# download the freshest AkWarm data.
+LIB_TIMEOUT = 12.0  # units are Hours
+
+
+def get_df(file_path):
+    """Returns a Pandas DataFrame that is found at the 'file_path'
+    below the Base URL for accessing data.  The 'file_path' should end
+    with '.pkl' and points to a pickled, compressed (bz2), Pandas DataFrame.
+    """
+    b = requests.get(urllib.parse.urljoin(base_url, file_path)).content
+    df = pd.read_pickle(io.BytesIO(b), compression="bz2")
+    return df
+
+
+# --------------------------------------------------------------------------------------
+
+
+def download_data() -> dict:
+    """Reads the library datasets from the remote server and the local 'data'
+    directory. Returns a dictionary of the DataFrames, keyed by the name of the
+    module-level variable that holds each one.
+    """
+    # read in the DataFrame that describes the available TMY3 climate files.
+    df_tmy_meta = get_df("tmy3/tmy3_meta.pkl")
+    df_tmy_meta["tmy_id"] = df_tmy_meta.index.values
+
+    # Read in the other City and Utility Excel files.
+    df_city = get_df("city.pkl")
+    # Need to add an empty column for the price of Wood Pellets
+    df_city["WoodPelletsPrice"] = float("nan")
+
+    # Retrive the list of utilities
+    df_util = get_df("utility.pkl")
+    # Only keep the ones that are Active and not Test objects.
+    df_util = df_util.query("Active == 1 and IsTestObject == 0").copy()
+    # drop unneeded columns
+    df_util.drop(columns=["Active", "IsTestObject", "NameShort"], inplace=True)
+
+    # Retrieve the Fuel characteristics, modify into better format, and store in a DataFrame
+    df_fuel = pd.read_excel(os.path.join(data_dir, "Fuel.xlsx"), index_col="id")
+    df_fuel["btus"] = df_fuel.btus.astype(float)
+
+    # Change the Efficiency choices column into a Python list (it is a string
+    # right now.)
+    df_fuel["effic_choices"] = df_fuel.effic_choices.apply(eval)
+
+    return {
+        "df_tmy_meta": df_tmy_meta,
+        "df_city": df_city,
+        "df_util": df_util,
+        "df_fuel": df_fuel,
+    }
+
+
+def write_cache(datasets: dict):
+    """Pickles the library datasets returned by download_data() to the cache file.
+    The file is written under a temporary name and then renamed, so a server process
+    never reads a partially written file.
+    """
+    temp_path = CACHE_PATH + ".tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(datasets, f, protocol=5)
+    os.replace(temp_path, CACHE_PATH)
+
+
+def read_cache() -> tuple | None:
+    """Returns a tuple of the library datasets stored in the cache file and the time
+    the file was written (a Unix timestamp). Returns None if there is no cache file,
+    if it is LIB_TIMEOUT hours old or older, or if it can't be read, e.g. it is
+    corrupt or was written by incompatible package versions.
+    """
+    try:
+        cache_ts = os.path.getmtime(CACHE_PATH)
+        if time.time() - cache_ts >= LIB_TIMEOUT * 3600.0:
+            return None
+        with open(CACHE_PATH, "rb") as f:
+            return pickle.load(f), cache_ts
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+        ValueError,
+    ):
+        return None
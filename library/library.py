@@ -7,44 +7,26 @@ variables and made available to other modules via functions.
 See the bottom is file for documentation of those datasets.
 """
 
-import os
-import io
 import functools
-import urllib
 import time
 from typing import List
 import threading
 
 import pandas as pd
-import requests
 
 from general.models import Choice
 from general.utils import nan_to_none, dataframe_to_models
 from library.models import City, Utility, Fuel, FuelPrice, TMYmeta, TMYdataset
-
-# Most of the data files are located remotely and are retrieved via
-# an HTTP request.
-# The base URL to the site where the remote files are located
-base_url = "https://github.com/alanmitchell/akwlib-export/raw/main/data/v01/"
-
-# This constant controls how frequently the library goes back to the GitHub server to
-# download the freshest AkWarm data.
-LIB_TIMEOUT = 12.0  # units are Hours
-
-
-def get_df(file_path):
-    """Returns a Pandas DataFrame that is found at the 'file_path'
-    below the Base URL for accessing data.  The 'file_path' should end
-    with '.pkl' and points to a pickled, compressed (bz2), Pandas DataFrame.
-    """
-    b = requests.get(urllib.parse.urljoin(base_url, file_path)).content
-    df = pd.read_pickle(io.BytesIO(b), compression="bz2")
-    return df
+from library.datasets import LIB_TIMEOUT, get_df, download_data, read_cache
 
 
 # -----------------------------------------------------------------
 # Functions to provide the library data to the rest of the
 # application.
+# The library data only changes when refresh_data() runs, so the results of
+# these functions are cached; refresh_data() clears the caches. The returned
+# objects are shared by all callers and must not be modified.
+@functools.lru_cache(maxsize=None)
 def cities() -> List[Choice]:
     """List of all (city name, city ID), alphabetically sorted."""
     city_list = list(zip(df_city.Name, df_city.index))
@@ -52,6 +34,7 @@ def cities() -> List[Choice]:
     return [Choice(label=label, id=id) for label, id in city_list]
 
 
+@functools.lru_cache(maxsize=4096)
 def city_from_id(city_id) -> City:
     """Returns a dictionary containing the city information for the City
     identified by 'city_id'.
@@ -70,6 +53,7 @@ def city_from_id(city_id) -> City:
 # --------------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def utilities() -> List[Choice]:
     """List of all utility rate structures, sorted by utility rate name."""
     util_list = list(zip(df_util.Name, df_util.index))
@@ -77,6 +61,7 @@ def utilities() -> List[Choice]:
     return [Choice(label=label, id=id) for label, id in util_list]
 
 
+@functools.lru_cache(maxsize=4096)
 def util_from_id(util_id) -> Utility:
     """Returns a dictionary containing all of the Utility information for
     the Utility identified by util_id.
@@ -89,12 +74,14 @@ def util_from_id(util_id) -> Utility:
 # --------------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def fuels() -> List[Choice]:
     """Returns a list of fuel names and IDs."""
     fuel_list = list(zip(df_fuel.desc, df_fuel.index))
     return [Choice(label=label, id=id) for label, id in fuel_list]
 
 
+@functools.lru_cache(maxsize=4096)
 def fuel_from_id(fuel_id) -> Fuel:
     """Returns fuel information for the fuel with
     and ID of 'fuel_id'
@@ -104,6 +91,7 @@ def fuel_from_id(fuel_id) -> Fuel:
     return Fuel(**fuel_dict)
 
 
+@functools.lru_cache(maxsize=4096)
 def fuel_price(fuel_id, city_id) -> FuelPrice:
     """Returns the fuel price for the fuel identified by the ID of
     'fuel_id' for the city identified by 'city_id'.
@@ -125,21 +113,30 @@ def fuel_price(fuel_id, city_id) -> FuelPrice:
 # --------------------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def tmys() -> List[TMYmeta]:
     """Returns a list of available TMY sites and associated info."""
     return dataframe_to_models(df_tmy_meta, TMYmeta)
 
 
 @functools.lru_cache(maxsize=50)  # caches the TMY dataframes cuz retrieved remotely
+def tmy_df_from_id(tmy_id) -> pd.DataFrame:
+    """Returns a DataFrame of the TMY hourly records for the climate site identified
+    by 'tmy_id', including an 'hour' column.
+    """
+    df_records = get_df(f"tmy3/{tmy_id}.pkl")
+    df_records["hour"] = list(range(0, 24)) * 365
+    return df_records
+
+
+@functools.lru_cache(maxsize=50)
 def tmy_from_id(tmy_id, site_info_only=False) -> TMYdataset:
     """Returns a list of TMY hourly records and meta data for the climate site identified
     by 'tmy_id'.
     """
     site_info = TMYmeta(**df_tmy_meta.loc[tmy_id].to_dict())
     if not site_info_only:
-        df_records = get_df(f"tmy3/{tmy_id}.pkl")
-        df_records["hour"] = list(range(0, 24)) * 365
-        recs_dict = df_records.to_dict(orient="list")
+        recs_dict = tmy_df_from_id(tmy_id).to_dict(orient="list")
         return TMYdataset(site_info=site_info, hourly_data=recs_dict)
     else:
         return TMYdataset(site_info=site_info)
@@ -161,43 +158,47 @@ def refresh_data():
     print("acquiring library data...")
 
     # Key datasets are read in here and are available as module-level
-    # variables for use in the functions above.
-
-    # read in the DataFrame that describes the available TMY3 climate files.
-    df_tmy_meta = get_df("tmy3/tmy3_meta.pkl")
-    df_tmy_meta["tmy_id"] = df_tmy_meta.index.values
-
-    # Read in the other City and Utility Excel files.
-    df_city = get_df("city.pkl")
-    # Need to add an empty column for the price of Wood Pellets
-    df_city["WoodPelletsPrice"] = float("nan")
-
-    # Retrive the list of utilities
-    df_util = get_df("utility.pkl")
-    # Only keep the ones that are Active and not Test objects.
-    df_util = df_util.query("Active == 1 and IsTestObject == 0").copy()
-    # drop unneeded columns
-    df_util.drop(columns=["Active", "IsTestObject", "NameShort"], inplace=True)
-
-    # Retrieve the Fuel characteristics, modify into better format, and store in a DataFrame
-
-    # Determine the directory where the local data files are located
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    data_dir = os.path.join(this_dir, "data")
-
-    df_fuel = pd.read_excel(os.path.join(data_dir, "Fuel.xlsx"), index_col="id")
-    df_fuel["btus"] = df_fuel.btus.astype(float)
-
-    # Change the Efficiency choices column into a Python list (it is a string
-    # right now.)
-    df_fuel["effic_choices"] = df_fuel.effic_choices.apply(eval)
+    # variables for use in the functions above. Use the prebuilt cache file if it
+    # is fresh, so each server worker doesn't download and process the data.
+    # The data time is when the data was acquired, so the next refresh is timed
+    # from when the cache file was written, not from when it was read.
+    cached = read_cache()
+    if cached is not None:
+        datasets, data_ts = cached
+    else:
+        datasets, data_ts = download_data(), time.time()
+
+    df_tmy_meta = datasets["df_tmy_meta"]
+    df_city = datasets["df_city"]
+    df_util = datasets["df_util"]
+    df_fuel = datasets["df_fuel"]
+    last_lib_download_ts = data_ts
+
+    # discard results cached from the prior data. This is done after all of the new
+    # data and its timestamp are in place, so any lookup made after the caches are
+    # cleared sees only the new data.
+    for func in (
+        cities,
+        city_from_id,
+        utilities,
+        util_from_id,
+        fuels,
+        fuel_from_id,
+        fuel_price,
+        tmys,
+        tmy_df_from_id,
+        tmy_from_id,
+    ):
+        func.cache_clear()
 
 
 def periodically_refresh_data():
-    """Function to periodically refresh the library data"""
+    """Function to periodically refresh the library data, so that it is never more
+    than LIB_TIMEOUT hours old.
+    """
     while True:
         refresh_data()
-        time.sleep(LIB_TIMEOUT * 3600.0)
+        time.sleep(max(0.0, last_lib_download_ts + LIB_TIMEOUT * 3600.0 - time.time()))
 
 
 # -----------------------------------------------
@@ -211,6 +212,10 @@ df_tmy_meta = None
 df_city = None
 df_util = None
 df_fuel = None
+# Time the current library data was acquired. Caches of values derived from the
+# library data outside this module include it in their keys, so they don't serve
+# results from data that has since been refreshed.
+last_lib_download_ts = None
 
 # start a thread to refresh data periodically
 thread = threading.Thread(target=periodically_refresh_data)
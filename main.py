@@ -1,5 +1,24 @@
+import os
+
 import uvicorn
-from app import app
+
+
+def worker_count() -> int:
+    """Number of server worker processes. Uses the WEB_CONCURRENCY environment
+    variable if set, otherwise 2 * (CPU count) + 1. The models are CPU bound, so
+    requests are spread across processes rather than threads.
+    """
+    if "WEB_CONCURRENCY" in os.environ:
+        return int(os.environ["WEB_CONCURRENCY"])
+    return 2 * (os.cpu_count() or 1) + 1
+
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # The app is passed as an import string, which uvicorn requires to start
+    # multiple workers.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=worker_count(),
+    )